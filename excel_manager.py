@@ -7,6 +7,9 @@
 Requirements:
     - Python 3.10+
     - openpyxl
+    - lxml（任意: 書き込み専用モードでのメモリ使用量をさらに抑えられます）
+    - numpy（任意: read_range_array を使用する場合）
+    - xlsxwriter / pyexcelerate（任意: 書き込み用のバックエンドとして使用する場合）
 
 Typical usage example:
     >>> excel = ExcelManager("data.xlsx")
@@ -16,18 +19,292 @@ Typical usage example:
 """
 
 # 標準ライブラリ
-import os
 import sys
 import argparse
+import logging
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Any, Optional, Tuple, Union
+from typing import TYPE_CHECKING, List, Any, Iterator, Literal, Optional, Tuple, Union
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
 
 # サードパーティライブラリ
+import openpyxl.writer.excel
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import column_index_from_string, get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
+if TYPE_CHECKING:
+    import numpy as np
+
+_log = logging.getLogger(__name__)
+
+
+def make_border(style: str = 'thin') -> Border:
+    """
+    上下左右に同じ線種を設定した罫線を返します。
+
+    同じ線種の罫線は一度だけ生成してキャッシュし、以降は同じオブジェクトを返します。
+
+    Args:
+        style (str): 線種（例: 'thin', 'medium', 'double'）（デフォルト: 'thin'）
+
+    Returns:
+        Border: 罫線
+
+    Raises:
+        ValueError: 無効な線種の場合
+    """
+    # 引数の渡し方によらず同じキャッシュを使うよう、位置引数に揃えて呼び出す
+    return _make_border(style)
+
+
+@lru_cache(maxsize=16)
+def _make_border(style: str) -> Border:
+    """make_border の実体です。線種ごとに生成した罫線をキャッシュします。"""
+    side = Side(style=style)
+    return Border(left=side, right=side, top=side, bottom=side)
+
+
+# 書式オブジェクトはセルごとに生成せず、モジュール共通のものを使い回す
+_THIN_BORDER = make_border('thin')
+_HEADER_FONT = Font(bold=True)
+_HEADER_FILL = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+_HEADER_ALIGNMENT = Alignment(horizontal="center")
+
+# Excelのワークシートの最大行数・最大列数（列 'XFD'）
+_MAX_ROW = 1048576
+_MAX_COL = 16384
+
+# この文字数未満の文字列の値はインターンして書き込む
+_INTERN_MAX_LEN = 64
+
+
+@lru_cache(maxsize=1024)
+def _col_idx(column: str) -> int:
+    """列記号（'A'など）を列番号に変換します。同じ列記号の変換結果はキャッシュされます。"""
+    return column_index_from_string(column)
+
+
+@lru_cache(maxsize=1024)
+def _col_letter(col_idx: int) -> str:
+    """列番号を列記号（'A'など）に変換します。同じ列番号の変換結果はキャッシュされます。"""
+    return get_column_letter(col_idx)
+
+
+def _maybe_intern(value: Any) -> Any:
+    """
+    短い文字列をインターンして返します。それ以外の値はそのまま返します。
+
+    分類名などの同じ文字列が繰り返し書き込まれる場合に、同じ文字列オブジェクトを
+    共有させてメモリ使用量と共有文字列テーブルでの比較コストを抑えます。
+    """
+    if type(value) is str and len(value) < _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
+
+
+def _as_rows(data: Any) -> List[Any]:
+    """
+    書き込むデータを行のリストに変換します。
+
+    リストまたはタプルの行からなるリストはそのまま返します。NumPy配列はPythonの値のリストに、
+    ジェネレーターなどの反復可能オブジェクトは行ごとにリストへ変換します。
+    """
+    if isinstance(data, list) and all(isinstance(row_data, (list, tuple)) for row_data in data):
+        return data
+    if hasattr(data, 'tolist'):
+        data = data.tolist()
+    return [row_data if isinstance(row_data, (list, tuple)) else list(row_data) for row_data in data]
+
+
+def _to_col(column: Union[int, str]) -> int:
+    """列番号（1始まり）または列記号（'A'など）を列番号に変換します。"""
+    if isinstance(column, int):
+        return column
+    return _col_idx(column)
+
+
+@contextmanager
+def _zip_options(compression: int, compresslevel: Optional[int]) -> Iterator[None]:
+    """
+    保存中だけ、openpyxlが使用するZIPの圧縮方式と圧縮レベルを差し替えます。
+
+    openpyxlは圧縮方式を固定して ZipFile を生成するため、保存の間だけ
+    openpyxl.writer.excel.ZipFile を置き換え、終了後に元に戻します。
+
+    Args:
+        compression (int): 圧縮方式（ZIP_DEFLATED または ZIP_STORED）
+        compresslevel (Optional[int]): 圧縮レベル（0～9、None の場合は既定値）
+    """
+    def zip_file(file: Any, mode: str, _compression: int, allowZip64: bool = True) -> ZipFile:
+        return ZipFile(file, mode, compression, allowZip64=allowZip64, compresslevel=compresslevel)
+
+    original = openpyxl.writer.excel.ZipFile
+    openpyxl.writer.excel.ZipFile = zip_file
+    try:
+        yield
+    finally:
+        openpyxl.writer.excel.ZipFile = original
+
+
+def _split_ref(ref: str) -> Tuple[int, int]:
+    """
+    A1形式のセル参照（'B2'、'$B$2'など）を行番号と列番号に分割します。
+
+    正規表現を使わず、先頭から列記号と行番号を1文字ずつ読み取ります。
+
+    Args:
+        ref (str): セル参照
+
+    Returns:
+        Tuple[int, int]: 行番号と列番号
+
+    Raises:
+        ValueError: セル参照の形式が正しくない場合、またはシートの範囲外の場合
+    """
+    n: int = len(ref)
+    i: int = 1 if n and ref[0] == '$' else 0
+    col_start: int = i
+    col: int = 0
+    while i < n:
+        # 英字は 0x20 を立てると小文字になり、'a'～'z' が 1～26 に対応する
+        code = ord(ref[i]) | 0x20
+        if not 0x61 <= code <= 0x7A:
+            break
+        col = col * 26 + (code - 0x60)
+        i += 1
+    col_len: int = i - col_start
+    if i < n and ref[i] == '$':
+        i += 1
+    row_start: int = i
+    row: int = 0
+    while i < n:
+        digit = ord(ref[i]) - 0x30
+        if not 0 <= digit <= 9:
+            raise ValueError(f"無効なセル参照です: {ref}")
+        row = row * 10 + digit
+        i += 1
+    if not 1 <= col_len <= 3 or i == row_start:
+        raise ValueError(f"無効なセル参照です: {ref}")
+    if not 1 <= row <= _MAX_ROW or col > _MAX_COL:
+        raise ValueError(f"無効なセル参照です: {ref}（シートの範囲外です）")
+    return row, col
+
+
+class _XlsxWriterBackend:
+    """
+    xlsxwriter を使って新規ファイルを書き込むバックエンド
+
+    ExcelManager と同じヘッダー書式・罫線を xlsxwriter の書式で再現します。
+    """
+
+    def __init__(self, filename: str) -> None:
+        try:
+            import xlsxwriter
+            from xlsxwriter.exceptions import FileCreateError
+        except ImportError:
+            raise ImportError("backend='xlsxwriter' を使用するには xlsxwriter をインストールしてください")
+        self._file_create_error = FileCreateError
+        self._wb = xlsxwriter.Workbook(filename)
+        self._sheets: dict[str, Any] = {}
+        self._header_format = self._wb.add_format(
+            {'bold': True, 'bg_color': '#CCCCCC', 'pattern': 1, 'align': 'center', 'border': 1}
+        )
+        self._border_format = self._wb.add_format({'border': 1})
+
+    def has_sheet(self, sheet_name: str) -> bool:
+        return sheet_name in self._sheets
+
+    def create_sheet(self, sheet_name: str, headers: Optional[List[str]]) -> Any:
+        ws = self._wb.add_worksheet(sheet_name)
+        self._sheets[sheet_name] = ws
+        if headers:
+            ws.write_row(0, 0, headers, self._header_format)
+            ws.set_column(0, len(headers) - 1, 15)
+        return ws
+
+    def write_row(self, sheet_name: str, row_idx: int, col_idx: int, row: List[Any], apply_border: bool) -> None:
+        # xlsxwriter の行・列番号は0始まり
+        self._sheets[sheet_name].write_row(
+            row_idx - 1, col_idx - 1, row, self._border_format if apply_border else None
+        )
+
+    def save(self) -> None:
+        try:
+            self._wb.close()
+        except self._file_create_error as e:
+            # xlsxwriter はファイル作成時の OSError を FileCreateError で包むため、元の例外に戻す
+            cause = e.args[0] if e.args else None
+            if isinstance(cause, OSError):
+                raise cause
+            raise OSError(str(e))
+
+
+class _PyExcelerateBackend:
+    """
+    pyexcelerate を使って新規ファイルを書き込むバックエンド
+
+    ExcelManager と同じヘッダー書式・罫線を pyexcelerate のスタイルで再現します。
+    値が None のセルは書き込まないため、罫線も設定されません。
+    """
+
+    def __init__(self, filename: str) -> None:
+        try:
+            import pyexcelerate
+            from pyexcelerate.Border import Border as PxBorder
+            from pyexcelerate.Borders import Borders as PxBorders
+        except ImportError:
+            raise ImportError("backend='pyexcelerate' を使用するには pyexcelerate をインストールしてください")
+        self._filename: str = filename
+        self._wb = pyexcelerate.Workbook()
+        self._sheets: dict[str, Any] = {}
+        side = PxBorder(style='thin')
+        borders = PxBorders(left=side, right=side, top=side, bottom=side)
+        self._border_style = pyexcelerate.Style(borders=borders)
+        self._header_style = pyexcelerate.Style(
+            font=pyexcelerate.Font(bold=True),
+            fill=pyexcelerate.Fill(background=pyexcelerate.Color(0xCC, 0xCC, 0xCC)),
+            alignment=pyexcelerate.Alignment(horizontal='center'),
+            borders=borders
+        )
+        self._width_style = pyexcelerate.Style(size=15)
+
+    def has_sheet(self, sheet_name: str) -> bool:
+        return sheet_name in self._sheets
+
+    def create_sheet(self, sheet_name: str, headers: Optional[List[str]]) -> Any:
+        ws = self._wb.new_sheet(sheet_name)
+        self._sheets[sheet_name] = ws
+        if headers:
+            for col, header in enumerate(headers, 1):
+                ws.set_cell_value(1, col, header)
+                ws.set_cell_style(1, col, self._header_style)
+                ws.set_col_style(col, self._width_style)
+        return ws
+
+    def write_row(self, sheet_name: str, row_idx: int, col_idx: int, row: List[Any], apply_border: bool) -> None:
+        ws = self._sheets[sheet_name]
+        for col, value in enumerate(row, col_idx):
+            # pyexcelerate は値のないセルに書式を設定すると空文字列を書き込むため、None のセルは書き込まない
+            if value is None:
+                continue
+            ws.set_cell_value(row_idx, col, value)
+            if apply_border:
+                ws.set_cell_style(row_idx, col, self._border_style)
+
+    def save(self) -> None:
+        self._wb.save(self._filename)
+
+
+_BACKENDS = {
+    'xlsxwriter': _XlsxWriterBackend,
+    'pyexcelerate': _PyExcelerateBackend,
+}
+
+
 class ExcelManager:
     """
     Excelファイルを操作するためのシンプルなマネージャークラス
@@ -38,35 +315,218 @@ class ExcelManager:
 
     Attributes:
         filename (str): 操作対象のExcelファイルパス
-        wb (Workbook): openpyxlのWorkbookオブジェクト
+        wb (Workbook): openpyxlのWorkbookオブジェクト（openpyxl以外のバックエンドでは None）
 
     Raises:
         Exception: ファイルの読み込みに失敗した場合
     """
 
-    def __init__(self, filename: str | Path) -> None:
+    def __init__(
+        self,
+        filename: str | Path,
+        write_only: bool = False,
+        read_only: bool = False,
+        backend: Literal['openpyxl', 'xlsxwriter', 'pyexcelerate'] = 'openpyxl'
+    ) -> None:
         """
         ExcelManagerを初期化します。
 
         既存のファイルが存在する場合はそれを読み込み、
         存在しない場合は新規ファイルを作成します。
+        既存のファイルの読み込みは、最初にワークブックを操作するときまで遅延されます。
+
+        write_only を指定すると、大量データの出力向けに書き込み専用モードで
+        新規ファイルを作成します。行は書き込んだ順にファイルへ逐次出力されるため
+        メモリ使用量を大きく抑えられますが、使用できるのは create_sheet、
+        write_data、write_array、save のみで、書き込み済みの行へ戻って書き込むことはできません。
+        lxml がインストールされている場合はさらにメモリ使用量が削減されます。
+
+        read_only を指定すると、既存のファイルを読み取り専用モードで開きます。
+        セルの書式や数式を読み込まず、数式のセルは最後に計算された値を返すため、
+        大きなシートの読み込みが高速になります。書き込み系のメソッドは使用できず、
+        ファイルを開いたままになるため、使用後は close を呼び出してください。
+
+        backend に 'xlsxwriter' または 'pyexcelerate' を指定すると、新規ファイルの
+        書き込みをopenpyxlより高速なライブラリで行います。使用できるのは create_sheet、
+        write_data、write_array、save のみで、読み込み系のメソッドにはopenpyxlが必要です。
 
         Args:
             filename (str | Path): Excelファイルのパス
+            write_only (bool): 書き込み専用モードで作成するかどうか（デフォルト: False）
+            read_only (bool): 読み取り専用モードで開くかどうか（デフォルト: False）
+            backend (Literal['openpyxl', 'xlsxwriter', 'pyexcelerate']): 使用するライブラリ
+                （デフォルト: 'openpyxl'）
 
         Raises:
-            Exception: ファイルの読み込みに失敗した場合
+            ValueError: 書き込み専用モードまたはopenpyxl以外のバックエンドで既存のファイルを指定した場合、
+                write_only と read_only を同時に指定した場合、
+                またはopenpyxl以外のバックエンドと write_only / read_only を同時に指定した場合
+            FileNotFoundError: 読み取り専用モードでファイルが存在しない場合
+            ImportError: 指定したバックエンドのライブラリがインストールされていない場合
         """
+        if write_only and read_only:
+            raise ValueError("write_only と read_only は同時に指定できません")
+        if backend != 'openpyxl' and backend not in _BACKENDS:
+            raise ValueError(f"無効なバックエンドです: {backend}")
+        if backend != 'openpyxl' and (write_only or read_only):
+            raise ValueError(f"backend='{backend}' では write_only / read_only は指定できません")
         self.filename: str = str(filename)
-        if os.path.exists(self.filename):
-            try:
-                self.wb: Workbook = load_workbook(self.filename)
-                print(f"既存のファイル '{self.filename}' を読み込みました")
-            except Exception as e:
-                raise Exception(f"ファイル読み込みエラー: {str(e)}")
+        self._write_only: bool = write_only
+        self._read_only: bool = read_only
+        self._backend_name: str = backend
+        self._backend: Optional[_XlsxWriterBackend | _PyExcelerateBackend] = None
+        # 書き込み専用モードでシートごとに次に書き込まれる行番号
+        self._next_rows: dict[str, int] = {}
+        # 書き込み専用モードのワークブックは一度しか保存できないため、保存済みかどうかを記録する
+        self._saved: bool = False
+        is_file: bool = Path(self.filename).is_file()
+        self._wb: Optional[Workbook] = None
+        # 既存のファイルは、最初に self.wb を参照したときに読み込む
+        self._needs_load: bool = False
+        if backend != 'openpyxl':
+            if is_file:
+                raise ValueError(f"backend='{backend}' では既存のファイルを開けません: '{self.filename}'")
+            self._backend = _BACKENDS[backend](self.filename)
+            _log.info("新規ファイル '%s' を %s で作成しました", self.filename, backend)
+        elif write_only:
+            if is_file:
+                raise ValueError(f"書き込み専用モードでは既存のファイルを開けません: '{self.filename}'")
+            self._wb = Workbook(write_only=True)
+            _log.info("新規ファイル '%s' を書き込み専用モードで作成しました", self.filename)
+        elif read_only:
+            if not is_file:
+                raise FileNotFoundError(f"ファイル '{self.filename}' が存在しません")
+            self._needs_load = True
+        elif is_file:
+            self._needs_load = True
         else:
-            self.wb = Workbook()
-            print(f"新規ファイル '{self.filename}' を作成しました")
+            _log.info("新規ファイル '%s' を作成しました", self.filename)
+        # シート名からワークシートを引くための辞書（sheetnames は参照のたびにリストを作り直すため）
+        self._sheet_lookup: dict[str, Worksheet] = {}
+
+    @property
+    def wb(self) -> Optional[Workbook]:
+        """
+        openpyxlのWorkbookオブジェクト
+
+        既存のファイルは、最初に参照されたときに読み込みます。
+        openpyxl以外のバックエンドでは None を返します。
+
+        Raises:
+            Exception: ファイルの読み込みに失敗した場合
+        """
+        if self._wb is None and self._backend is None:
+            if self._needs_load:
+                try:
+                    if self._read_only:
+                        self._wb = load_workbook(self.filename, read_only=True, data_only=True)
+                        _log.info("既存のファイル '%s' を読み取り専用モードで読み込みました", self.filename)
+                    else:
+                        self._wb = load_workbook(self.filename)
+                        _log.info("既存のファイル '%s' を読み込みました", self.filename)
+                except Exception as e:
+                    raise Exception(f"ファイル読み込みエラー: {str(e)}")
+            else:
+                self._wb = Workbook()
+        return self._wb
+
+    @wb.setter
+    def wb(self, wb: Workbook) -> None:
+        self._wb = wb
+        self._sheet_lookup = {}
+
+    def _ensure_random_access(self) -> None:
+        """
+        セル単位の読み書きができるモードであることを確認します。
+
+        Raises:
+            ValueError: 書き込み専用モード、またはopenpyxl以外のバックエンドの場合
+        """
+        self._ensure_openpyxl()
+        if self._write_only:
+            raise ValueError("書き込み専用モードではセル単位の読み書きはできません")
+
+    def _ensure_openpyxl(self) -> None:
+        """
+        openpyxlのワークブックを操作できることを確認します。
+
+        Raises:
+            ValueError: openpyxl以外のバックエンドの場合
+        """
+        if self._backend is not None:
+            raise ValueError(
+                f"backend='{self._backend_name}' では create_sheet、write_data、write_array、save 以外は使用できません"
+            )
+
+    def _ensure_writable(self) -> None:
+        """
+        ワークブックへ書き込みができるモードであることを確認します。
+
+        Raises:
+            ValueError: 読み取り専用モードの場合
+        """
+        if self._read_only:
+            raise ValueError("読み取り専用モードでは書き込みできません")
+
+    def _get_sheet(self, sheet_name: str) -> Worksheet:
+        """
+        シート名に対応するワークシートを取得します。
+
+        Args:
+            sheet_name (str): シート名
+
+        Returns:
+            Worksheet: ワークシート
+
+        Raises:
+            ValueError: シートが存在しない場合、またはopenpyxl以外のバックエンドの場合
+        """
+        self._ensure_openpyxl()
+        ws = self._sheet_lookup.get(sheet_name)
+        if ws is not None and (ws.title != sheet_name or ws not in self.wb._sheets):
+            # self.wb を直接操作して名前を変更・削除されたシートは辞書に残さない
+            ws = None
+        if ws is None:
+            # self.wb を直接操作して追加・変更されたシートに備えて辞書を作り直す
+            self._sheet_lookup = {sheet.title: sheet for sheet in self.wb.worksheets}
+            ws = self._sheet_lookup.get(sheet_name)
+            if ws is None:
+                raise ValueError(f"シート '{sheet_name}' が存在しません")
+        return ws
+
+    def _resolve_number_format(self, number_format: str) -> str:
+        """
+        数値書式を検証し、インターンした文字列を返します。
+
+        Args:
+            number_format (str): 数値書式
+
+        Returns:
+            str: インターンされた数値書式
+
+        Raises:
+            ValueError: 数値書式が文字列でない場合
+        """
+        if not isinstance(number_format, str):
+            raise ValueError(f"数値書式は文字列で指定してください: {number_format!r}")
+        return sys.intern(number_format)
+
+    def get_sheet(self, sheet_name: str) -> Worksheet:
+        """
+        シート名に対応するワークシートを取得します。
+
+        取得したワークシートは write_cell_ws / read_cell_ws に渡すことができます。
+
+        Args:
+            sheet_name (str): シート名
+
+        Returns:
+            Worksheet: ワークシート
+
+        Raises:
+            ValueError: シートが存在しない場合、またはopenpyxl以外のバックエンドの場合
+        """
+        return self._get_sheet(sheet_name)
 
     def create_sheet(self, sheet_name: str, headers: Optional[List[str]] = None) -> Worksheet:
         """
@@ -84,68 +544,289 @@ class ExcelManager:
             headers (Optional[List[str]]): ヘッダー行のリスト
 
         Returns:
-            Worksheet: 作成されたワークシート
+            Worksheet: 作成されたワークシート（openpyxl以外のバックエンドでは、
+                そのライブラリのワークシートオブジェクト）
 
         Raises:
-            ValueError: 指定されたシート名が既に存在する場合
+            ValueError: 指定されたシート名が既に存在する場合、
+                または読み取り専用モードの場合
         """
+        self._ensure_writable()
+        if headers:
+            headers = [_maybe_intern(header) for header in headers]
+        if self._backend is not None:
+            if self._backend.has_sheet(sheet_name):
+                raise ValueError(f"シート '{sheet_name}' は既に存在します")
+            return self._backend.create_sheet(sheet_name, headers)
         if sheet_name in self.wb.sheetnames:
             raise ValueError(f"シート '{sheet_name}' は既に存在します")
         
         ws: Worksheet = self.wb.create_sheet(title=sheet_name)
+        self._sheet_lookup[ws.title] = ws
+        if self._write_only:
+            self._next_rows[sheet_name] = 1
+            if headers:
+                # 列幅は行を書き込む前に設定しておく必要がある
+                self._set_header_widths(ws, len(headers))
+                cells: List[WriteOnlyCell] = []
+                for header in headers:
+                    cell = WriteOnlyCell(ws, value=header)
+                    cell.font = _HEADER_FONT
+                    cell.fill = _HEADER_FILL
+                    cell.alignment = _HEADER_ALIGNMENT
+                    cell.border = _THIN_BORDER
+                    cells.append(cell)
+                ws.append(cells)
+                self._next_rows[sheet_name] = 2
+            return ws
         if headers:
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col)
-                cell.value = header
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center")
-                cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                ws.column_dimensions[get_column_letter(col)].width = 15
+            # 作成直後のシートは空のため、append でヘッダーを1行目に書き込んでから書式を設定する
+            ws.append(headers)
+            for cell in next(ws.iter_rows(min_row=1, max_row=1, max_col=len(headers))):
+                cell.font = _HEADER_FONT
+                cell.fill = _HEADER_FILL
+                cell.alignment = _HEADER_ALIGNMENT
+                cell.border = _THIN_BORDER
+            self._set_header_widths(ws, len(headers))
         return ws
 
-    def write_data(self, sheet_name: str, data: List[List[Any]], start_row: int = 1) -> None:
+    @staticmethod
+    def _set_header_widths(ws: Worksheet, col_count: int) -> None:
+        """
+        1列目から col_count 列目までの列幅を設定します。
+
+        後から個別の列幅を変更できるよう、列ごとに ColumnDimension を設定します。
+        列記号はキャッシュした変換結果を使用します。
+        """
+        for col_idx in range(1, col_count + 1):
+            ws.column_dimensions[_col_letter(col_idx)].width = 15
+
+    def write_data(
+        self,
+        sheet_name: str,
+        data: List[List[Any]],
+        start_row: int = 1,
+        apply_border: bool = True
+    ) -> None:
         """
         データをシートに書き込みます。
 
         2次元リストの形式でデータを受け取り、指定された行から順に書き込みます。
-        すべてのセルに自動的に罫線が適用されます。
+        すべてのセルに自動的に罫線が適用されます。罫線を最後にまとめて設定する場合は
+        apply_border に False を指定し、書き込み後に apply_borders を呼び出してください。
+
+        書き込み専用モードでは、start_row までの未使用の行を空行として出力した上で
+        データを追記します。
 
         Args:
             sheet_name (str): 書き込み先のシート名
-            data (List[List[Any]]): 書き込むデータ（2次元リスト）
+            data (List[List[Any]]): 書き込むデータ（2次元リスト。NumPyの2次元配列や行の反復可能オブジェクトも指定できます）
+            start_row (int): 書き込み開始行（デフォルト: 1）
+            apply_border (bool): 罫線を設定するかどうか（デフォルト: True）
+
+        Raises:
+            ValueError: シートが存在しない場合、無効な開始行の場合、
+                書き込み専用モードで書き込み済みの行を指定した場合、
+                または読み取り専用モードの場合
+        """
+        self._ensure_writable()
+        if start_row < 1:
+            raise ValueError(f"無効な行番号です: {start_row}")
+        data = _as_rows(data)
+        if self._backend is not None:
+            self._write_backend(sheet_name, data, start_row, 1, apply_border)
+            return
+        ws: Worksheet = self._get_sheet(sheet_name)
+        if self._write_only:
+            self._append_write_only(ws, sheet_name, data, start_row, apply_border=apply_border)
+            return
+        if not data:
+            return
+        # 各行の列数が揃っていれば、書き込み先の範囲全体を一度の iter_rows でまとめて走査する
+        col_count: int = len(data[0])
+        rectangular: bool = col_count > 0 and all(len(row_data) == col_count for row_data in data)
+        end_row: int = start_row + len(data) - 1
+        # append は max_row ではなく最後に書き込まれた行の次に追記するため、空のシートでは1行目になる
+        if start_row == ws._current_row + 1:
+            # 最終行の直後への追記は append の高速経路で値を書き込み、罫線は後からまとめて設定する
+            for row_data in data:
+                ws.append([_maybe_intern(value) for value in row_data])
+            if not apply_border:
+                return
+            if rectangular:
+                self._apply_border_range(ws, start_row, end_row, 1, col_count)
+                return
+            for row_idx, row_data in enumerate(data, start_row):
+                if not row_data:
+                    continue
+                row_cells = next(ws.iter_rows(min_row=row_idx, max_row=row_idx, max_col=len(row_data)))
+                for cell in row_cells:
+                    cell.border = _THIN_BORDER
+        elif rectangular:
+            for row_cells, row_data in zip(ws.iter_rows(min_row=start_row, max_row=end_row, max_col=col_count), data):
+                for cell, value in zip(row_cells, row_data):
+                    cell.value = _maybe_intern(value)
+                    if apply_border:
+                        cell.border = _THIN_BORDER
+        else:
+            for row_idx, row_data in enumerate(data, start_row):
+                if not row_data:
+                    continue
+                row_cells = next(ws.iter_rows(min_row=row_idx, max_row=row_idx, max_col=len(row_data)))
+                for cell, value in zip(row_cells, row_data):
+                    cell.value = _maybe_intern(value)
+                    if apply_border:
+                        cell.border = _THIN_BORDER
+
+    def write_array(
+        self,
+        sheet_name: str,
+        data: List[List[Any]],
+        start_row: int = 1,
+        start_col: Union[int, str] = 1,
+        apply_border: bool = True
+    ) -> None:
+        """
+        矩形の2次元データを指定した位置からまとめて書き込みます。
+
+        すべての行が同じ列数である必要があります。最終行の直後や書き込み専用モードでは
+        行単位の追記でまとめて書き込み、罫線は書き込んだ範囲へ最後に一度だけ設定します。
+        大量のデータを書き込む場合は、write_cell をループで呼び出すよりも高速です。
+
+        Args:
+            sheet_name (str): 書き込み先のシート名
+            data (List[List[Any]]): 書き込むデータ（すべての行が同じ列数の2次元リスト。NumPyの2次元配列も指定できます）
             start_row (int): 書き込み開始行（デフォルト: 1）
+            start_col (Union[int, str]): 書き込み開始列（デフォルト: 1）
+            apply_border (bool): 罫線を設定するかどうか（デフォルト: True）
+
+        Raises:
+            ValueError: シートが存在しない場合、データが矩形でない場合、無効な開始位置の場合、
+                書き込み専用モードで書き込み済みの行を指定した場合、
+                または読み取り専用モードの場合
+
+        Examples:
+            >>> excel.write_array("Sheet1", [[1, "a"], [2, "b"]], start_row=2)
+            >>> excel.write_array("Sheet1", [[100, 200]], start_row=5, start_col="C")
+        """
+        self._ensure_writable()
+        col_idx: int = _to_col(start_col)
+        if col_idx < 1:
+            raise ValueError(f"無効な列番号です: {col_idx}")
+        if start_row < 1:
+            raise ValueError(f"無効な行番号です: {start_row}")
+        data = _as_rows(data)
+        if not data:
+            return
+        col_count: int = len(data[0])
+        if any(len(row_data) != col_count for row_data in data):
+            raise ValueError("データの各行の列数が揃っていません")
+        if col_count == 0:
+            return
+
+        if self._backend is not None:
+            self._write_backend(sheet_name, data, start_row, col_idx, apply_border)
+            return
+        ws: Worksheet = self._get_sheet(sheet_name)
+        if self._write_only:
+            self._append_write_only(ws, sheet_name, data, start_row, col_idx, apply_border)
+            return
+
+        end_row: int = start_row + len(data) - 1
+        end_col: int = col_idx + col_count - 1
+        # write_data と同様に、append が実際に追記する行と一致する場合だけ高速経路を使う
+        if start_row == ws._current_row + 1:
+            padding: List[Any] = [None] * (col_idx - 1)
+            for row_data in data:
+                ws.append(padding + [_maybe_intern(value) for value in row_data])
+            if apply_border:
+                self._apply_border_range(ws, start_row, end_row, col_idx, end_col)
+        else:
+            for row_cells, row_data in zip(
+                ws.iter_rows(min_row=start_row, max_row=end_row, min_col=col_idx, max_col=end_col),
+                data
+            ):
+                for cell, value in zip(row_cells, row_data):
+                    cell.value = _maybe_intern(value)
+                    if apply_border:
+                        cell.border = _THIN_BORDER
+
+    def _write_backend(
+        self,
+        sheet_name: str,
+        data: List[List[Any]],
+        start_row: int,
+        start_col: int,
+        apply_border: bool
+    ) -> None:
+        """
+        openpyxl以外のバックエンドへ行単位でデータを書き込みます。
 
         Raises:
             ValueError: シートが存在しない場合
         """
-        if sheet_name not in self.wb.sheetnames:
+        if not self._backend.has_sheet(sheet_name):
             raise ValueError(f"シート '{sheet_name}' が存在しません")
-        
-        ws: Worksheet = self.wb[sheet_name]
         for row_idx, row_data in enumerate(data, start_row):
-            for col_idx, value in enumerate(row_data, 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                cell.value = value
-                cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
+            if row_data:
+                self._backend.write_row(
+                    sheet_name, row_idx, start_col, [_maybe_intern(value) for value in row_data], apply_border
                 )
 
+    def _append_write_only(
+        self,
+        ws: Worksheet,
+        sheet_name: str,
+        data: List[List[Any]],
+        start_row: int,
+        start_col: int = 1,
+        apply_border: bool = True
+    ) -> None:
+        """
+        書き込み専用モードのシートへ行を追記します。
+
+        start_row までの未使用の行は空行として出力し、start_col より左の列は空けます。
+
+        Args:
+            ws (Worksheet): 書き込み先のワークシート
+            sheet_name (str): 書き込み先のシート名
+            data (List[List[Any]]): 書き込むデータ（2次元リスト）
+            start_row (int): 書き込み開始行
+            start_col (int): 書き込み開始列（デフォルト: 1）
+            apply_border (bool): 罫線を設定するかどうか（デフォルト: True）
+
+        Raises:
+            ValueError: 書き込み済みの行を指定した場合
+        """
+        # self.wb.create_sheet で直接作成されたシートは未登録のため1行目から書き込む
+        next_row = self._next_rows.get(sheet_name, 1)
+        if start_row < next_row:
+            raise ValueError(
+                f"書き込み専用モードでは書き込み済みの行には書き込めません: {start_row}（次の行: {next_row}）"
+            )
+        for _ in range(start_row - next_row):
+            ws.append([])
+        padding: List[Any] = [None] * (start_col - 1)
+        for row_data in data:
+            if not apply_border:
+                ws.append(padding + [_maybe_intern(value) for value in row_data])
+                continue
+            row_cells: List[Any] = padding.copy()
+            for value in row_data:
+                cell = WriteOnlyCell(ws, value=_maybe_intern(value))
+                cell.border = _THIN_BORDER
+                row_cells.append(cell)
+            ws.append(row_cells)
+        self._next_rows[sheet_name] = start_row + len(data)
+
     def write_cell(
         self,
         sheet_name: str,
         row: int,
         column: Union[int, str],
         value: Any,
-        number_format: Optional[str] = None
+        number_format: Optional[str] = None,
+        apply_border: bool = True
     ) -> None:
         """
         指定したセルにデータを書き込みます。
@@ -159,44 +840,86 @@ class ExcelManager:
             column (Union[int, str]): 列番号（1から開始）または列記号（'A'など）
             value (Any): 書き込む値
             number_format (Optional[str]): 数値書式（例: '#,##0', 'yyyy/mm/dd'）
+            apply_border (bool): 罫線を設定するかどうか（デフォルト: True）
 
         Raises:
-            ValueError: シートが存在しない場合、または無効な列指定の場合
+            ValueError: シートが存在しない場合、または無効な列指定の場合、
+                または書き込み専用・読み取り専用モードの場合
+        """
+        ws: Worksheet = self._get_sheet(sheet_name)
+        self.write_cell_ws(ws, row, column, value, number_format, apply_border)
+
+    def write_cell_ws(
+        self,
+        ws: Worksheet,
+        row: int,
+        column: Union[int, str],
+        value: Any,
+        number_format: Optional[str] = None,
+        apply_border: bool = True
+    ) -> None:
+        """
+        取得済みのワークシートの指定したセルにデータを書き込みます。
+
+        write_cell と同じ動作ですが、シート名ではなく get_sheet で取得した
+        ワークシートを受け取ります。同じシートへループで書き込む場合に、
+        呼び出しごとのシートの検索を省略できます。
+
+        Args:
+            ws (Worksheet): get_sheet で取得したワークシート
+            row (int): 行番号（1から開始）
+            column (Union[int, str]): 列番号（1から開始）または列記号（'A'など）
+            value (Any): 書き込む値
+            number_format (Optional[str]): 数値書式（例: '#,##0', 'yyyy/mm/dd'）
+            apply_border (bool): 罫線を設定するかどうか（デフォルト: True）
+
+        Raises:
+            ValueError: 無効な列指定の場合、
+                または書き込み専用・読み取り専用モードの場合
+
+        Examples:
+            >>> ws = excel.get_sheet("Sheet1")
+            >>> for i, value in enumerate(values, 2):
+            ...     excel.write_cell_ws(ws, i, "A", value)
+        """
+        self._ensure_writable()
+        self._ensure_random_access()
+        col_idx: int = self._resolve_cell(row, column)
+        self._write_cell_on(ws, row, col_idx, value, number_format, apply_border)
+
+    def _write_cell_on(
+        self,
+        ws: Worksheet,
+        row: int,
+        col_idx: int,
+        value: Any,
+        number_format: Optional[str],
+        apply_border: bool
+    ) -> None:
+        """
+        検証済みの位置のセルに値・数値書式・罫線を設定します。
+
+        Raises:
+            ValueError: 無効な数値書式の場合
         """
-        if sheet_name not in self.wb.sheetnames:
-            raise ValueError(f"シート '{sheet_name}' が存在しません")
-        
-        ws: Worksheet = self.wb[sheet_name]
-        
-        try:
-            col_idx: int = column_index_from_string(column) if isinstance(column, str) else column
-            if col_idx < 1:
-                raise ValueError(f"無効な列番号です: {col_idx}")
-            if row < 1:
-                raise ValueError(f"無効な行番号です: {row}")
-        except ValueError as e:
-            raise ValueError(f"列指定が無効です: {str(e)}")
-        
         cell = ws.cell(row=row, column=col_idx)
-        cell.value = value
+        cell.value = _maybe_intern(value)
         if number_format:
+            fmt = self._resolve_number_format(number_format)
             try:
-                cell.number_format = number_format
+                cell.number_format = fmt
             except ValueError as e:
                 raise ValueError(f"無効な数値書式です: {number_format} - {str(e)}")
-        cell.border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        if apply_border:
+            cell.border = _THIN_BORDER
 
     def write_cell_a1(
         self,
         sheet_name: str,
         cell_reference: str,
         value: Any,
-        number_format: Optional[str] = None
+        number_format: Optional[str] = None,
+        apply_border: bool = True
     ) -> None:
         """
         A1形式でセルを指定してデータを書き込みます。
@@ -206,36 +929,145 @@ class ExcelManager:
             cell_reference (str): セル参照（例: 'A1', 'B2'）
             value (Any): 書き込む値
             number_format (Optional[str]): 数値書式（例: '#,##0', 'yyyy/mm/dd'）
+            apply_border (bool): 罫線を設定するかどうか（デフォルト: True）
 
         Raises:
-            ValueError: シートが存在しない場合、または無効なセル参照の場合
+            ValueError: シートが存在しない場合、または無効なセル参照の場合、
+                または書き込み専用・読み取り専用モードの場合
 
         Examples:
             >>> excel.write_cell_a1("Sheet1", "A1", 100)
             >>> excel.write_cell_a1("Sheet1", "B1", "2024/01/01", "yyyy/mm/dd")
         """
-        if sheet_name not in self.wb.sheetnames:
-            raise ValueError(f"シート '{sheet_name}' が存在しません")
-        
-        ws: Worksheet = self.wb[sheet_name]
+        self._ensure_writable()
+        self._ensure_random_access()
+        ws: Worksheet = self._get_sheet(sheet_name)
+
+        row, col_idx = _split_ref(cell_reference)
+        self._write_cell_on(ws, row, col_idx, value, number_format, apply_border)
+
+    def apply_borders(
+        self,
+        sheet_name: str,
+        min_row: int,
+        max_row: int,
+        min_col: Union[int, str],
+        max_col: Union[int, str],
+        style: str = 'thin'
+    ) -> None:
+        """
+        指定した範囲のすべてのセルに罫線を設定します。
 
+        apply_border=False で書き込んだデータに、最後にまとめて罫線を設定する場合に使用します。
+        列は数値（1始まり）または文字（'A'など）で指定できます。
+
+        Args:
+            sheet_name (str): シート名
+            min_row (int): 開始行
+            max_row (int): 終了行
+            min_col (Union[int, str]): 開始列
+            max_col (Union[int, str]): 終了列
+            style (str): 罫線の線種（例: 'thin', 'medium', 'double'）（デフォルト: 'thin'）
+
+        Raises:
+            ValueError: シートが存在しない場合、無効な範囲指定や線種の場合、
+                または書き込み専用・読み取り専用モードの場合
+
+        Examples:
+            >>> excel.write_data("Sheet1", data, start_row=2, apply_border=False)
+            >>> excel.apply_borders("Sheet1", 2, len(data) + 1, "A", "C")
+        """
+        self._ensure_writable()
+        self._ensure_random_access()
+        ws: Worksheet = self._get_sheet(sheet_name)
+
+        start_col, end_col = self._resolve_range(min_row, min_col, max_row, max_col)
         try:
-            cell = ws[cell_reference]
-        except (ValueError, KeyError) as e:
-            raise ValueError(f"無効なセル参照です: {cell_reference} - {str(e)}")
-        
-        cell.value = value
-        if number_format:
+            border: Border = make_border(style)
+        except ValueError as e:
+            raise ValueError(f"無効な罫線の線種です: {style} - {str(e)}")
+        self._apply_border_range(ws, min_row, max_row, start_col, end_col, border)
+
+    @staticmethod
+    def _resolve_cell(row: int, column: Union[int, str]) -> int:
+        """
+        セル位置を検証し、列を列番号に変換します。
+
+        Args:
+            row (int): 行番号（1から開始）
+            column (Union[int, str]): 列番号（1から開始）または列記号（'A'など）
+
+        Returns:
+            int: 列番号
+
+        Raises:
+            ValueError: 無効な列/行指定の場合
+        """
+        if isinstance(column, str):
             try:
-                cell.number_format = number_format
+                col_idx: int = _col_idx(column)
             except ValueError as e:
-                raise ValueError(f"無効な数値書式です: {number_format} - {str(e)}")
-        cell.border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+                raise ValueError(f"列指定が無効です: {str(e)}") from None
+        else:
+            col_idx = column
+        if not 1 <= col_idx <= _MAX_COL:
+            raise ValueError(f"無効な列番号です: {col_idx}")
+        if not 1 <= row <= _MAX_ROW:
+            raise ValueError(f"無効な行番号です: {row}")
+        return col_idx
+
+    @staticmethod
+    def _resolve_range(
+        start_row: int,
+        start_column: Union[int, str],
+        end_row: int,
+        end_column: Union[int, str]
+    ) -> Tuple[int, int]:
+        """
+        範囲指定を検証し、開始列と終了列を列番号に変換します。
+
+        Args:
+            start_row (int): 開始行
+            start_column (Union[int, str]): 開始列
+            end_row (int): 終了行
+            end_column (Union[int, str]): 終了列
+
+        Returns:
+            Tuple[int, int]: 開始列と終了列の列番号
+
+        Raises:
+            ValueError: 無効な範囲指定の場合
+        """
+        try:
+            if start_row < 1 or end_row < 1:
+                raise ValueError("行番号は1以上である必要があります")
+            if end_row < start_row:
+                raise ValueError("終了行は開始行以上である必要があります")
+            
+            start_col: int = _to_col(start_column)
+            end_col: int = _to_col(end_column)
+            
+            if start_col < 1 or end_col < 1:
+                raise ValueError("列番号は1以上である必要があります")
+            if end_col < start_col:
+                raise ValueError("終了列は開始列以上である必要があります")
+        except ValueError as e:
+            raise ValueError(f"範囲指定が無効です: {str(e)}")
+        return start_col, end_col
+
+    @staticmethod
+    def _apply_border_range(
+        ws: Worksheet,
+        min_row: int,
+        max_row: int,
+        min_col: int,
+        max_col: int,
+        border: Border = _THIN_BORDER
+    ) -> None:
+        """指定した範囲のセルに罫線を一度の走査で設定します。"""
+        for row_cells in ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col):
+            for cell in row_cells:
+                cell.border = border
 
     def read_cell(
         self,
@@ -257,22 +1089,32 @@ class ExcelManager:
             Any: セルの値
 
         Raises:
-            ValueError: シートが存在しない場合、または無効な列/行指定の場合
+            ValueError: シートが存在しない場合、または無効な列/行指定の場合、
+                または書き込み専用モードの場合
         """
-        if sheet_name not in self.wb.sheetnames:
-            raise ValueError(f"シート '{sheet_name}' が存在しません")
-            
-        ws: Worksheet = self.wb[sheet_name]
-        
-        try:
-            col_idx: int = column_index_from_string(column) if isinstance(column, str) else column
-            if col_idx < 1:
-                raise ValueError(f"無効な列番号です: {col_idx}")
-            if row < 1:
-                raise ValueError(f"無効な行番号です: {row}")
-        except ValueError as e:
-            raise ValueError(f"列指定が無効です: {str(e)}")
-            
+        ws: Worksheet = self._get_sheet(sheet_name)
+        return self.read_cell_ws(ws, row, column)
+
+    def read_cell_ws(self, ws: Worksheet, row: int, column: Union[int, str]) -> Any:
+        """
+        取得済みのワークシートの指定したセルの値を読み込みます。
+
+        read_cell と同じ動作ですが、シート名ではなく get_sheet で取得した
+        ワークシートを受け取ります。
+
+        Args:
+            ws (Worksheet): get_sheet で取得したワークシート
+            row (int): 行番号（1から開始）
+            column (Union[int, str]): 列番号（1から開始）または列記号（'A'など）
+
+        Returns:
+            Any: セルの値
+
+        Raises:
+            ValueError: 無効な列/行指定の場合、または書き込み専用モードの場合
+        """
+        self._ensure_random_access()
+        col_idx: int = self._resolve_cell(row, column)
         return ws.cell(row=row, column=col_idx).value
 
     def read_cell_a1(self, sheet_name: str, cell_reference: str) -> Any:
@@ -287,31 +1129,31 @@ class ExcelManager:
             Any: セルの値
 
         Raises:
-            ValueError: シートが存在しない場合、または無効なセル参照の場合
+            ValueError: シートが存在しない場合、または無効なセル参照の場合、
+                または書き込み専用モードの場合
 
         Examples:
             >>> value = excel.read_cell_a1("Sheet1", "A1")
             >>> value = excel.read_cell_a1("Sheet1", "B2")
         """
-        if sheet_name not in self.wb.sheetnames:
-            raise ValueError(f"シート '{sheet_name}' が存在しません")
-            
-        ws: Worksheet = self.wb[sheet_name]
-        return ws[cell_reference].value
+        self._ensure_random_access()
+        ws: Worksheet = self._get_sheet(sheet_name)
+        row, col_idx = _split_ref(cell_reference)
+        return ws.cell(row=row, column=col_idx).value
 
-    def read_range(
+    def read_range_iter(
         self,
         sheet_name: str,
         start_row: int,
         start_column: Union[int, str],
         end_row: int,
         end_column: Union[int, str]
-    ) -> List[List[Any]]:
+    ) -> Iterator[Tuple[Any, ...]]:
         """
-        指定した範囲のデータを読み込みます。
+        指定した範囲のデータを1行ずつタプルで返すイテレータを取得します。
 
-        開始位置と終了位置を指定して、その範囲内のデータを2次元リストとして取得します。
-        列は数値（1始まり）または文字（'A'など）で指定できます。
+        範囲全体をメモリに保持せずに行単位で処理できるため、read_only=True で開いた
+        大きなブックを読み込む場合に適しています。シートと範囲の検証は呼び出し時に行われます。
 
         Args:
             sheet_name (str): シート名
@@ -321,45 +1163,144 @@ class ExcelManager:
             end_column (Union[int, str]): 終了列
 
         Returns:
-            List[List[Any]]: 読み込んだデータ（2次元リスト）
+            Iterator[Tuple[Any, ...]]: 各行の値のタプルを返すイテレータ
 
         Raises:
-            ValueError: シートが存在しない場合、または無効な範囲指定の場合
+            ValueError: シートが存在しない場合、または無効な範囲指定の場合、
+                または書き込み専用モードの場合
+
+        Examples:
+            >>> total = sum(row[2] or 0 for row in excel.read_range_iter("Sheet1", 2, "A", 100000, "C"))
         """
-        if sheet_name not in self.wb.sheetnames:
-            raise ValueError(f"シート '{sheet_name}' が存在しません")
-            
-        ws: Worksheet = self.wb[sheet_name]
-        
-        try:
-            if start_row < 1 or end_row < 1:
-                raise ValueError("行番号は1以上である必要があります")
-            if end_row < start_row:
-                raise ValueError("終了行は開始行以上である必要があります")
-            
-            start_col: int = column_index_from_string(start_column) if isinstance(start_column, str) else start_column
-            end_col: int = column_index_from_string(end_column) if isinstance(end_column, str) else end_column
-            
-            if start_col < 1 or end_col < 1:
-                raise ValueError("列番号は1以上である必要があります")
-            if end_col < start_col:
-                raise ValueError("終了列は開始列以上である必要があります")
-        except ValueError as e:
-            raise ValueError(f"範囲指定が無効です: {str(e)}")
-            
-        data: List[List[Any]] = []
-        for row in ws.iter_rows(
+        self._ensure_random_access()
+        ws: Worksheet = self._get_sheet(sheet_name)
+        start_col, end_col = self._resolve_range(start_row, start_column, end_row, end_column)
+        return self._iter_range(ws, start_row, start_col, end_row, end_col)
+
+    @staticmethod
+    def _iter_range(
+        ws: Worksheet,
+        start_row: int,
+        start_col: int,
+        end_row: int,
+        end_col: int
+    ) -> Iterator[Tuple[Any, ...]]:
+        """検証済みの範囲の値を1行ずつ返します。"""
+        row_count: int = 0
+        for row_count, row in enumerate(ws.iter_rows(
             min_row=start_row,
             max_row=end_row,
             min_col=start_col,
             max_col=end_col,
             values_only=True
-        ):
-            data.append(list(row))
-            
-        return data
+        ), 1):
+            yield row
+        # 読み取り専用モードではシートの末尾より後ろの行が返されないため空行で埋める
+        empty_row: Tuple[Any, ...] = (None,) * (end_col - start_col + 1)
+        for _ in range(end_row - start_row + 1 - row_count):
+            yield empty_row
 
-    def save(self) -> None:
+    def read_range(
+        self,
+        sheet_name: str,
+        start_row: int,
+        start_column: Union[int, str],
+        end_row: int,
+        end_column: Union[int, str],
+        as_tuple: bool = False
+    ) -> List[List[Any]] | List[Tuple[Any, ...]]:
+        """
+        指定した範囲のデータを読み込みます。
+
+        開始位置と終了位置を指定して、その範囲内のデータを2次元リストとして取得します。
+        列は数値（1始まり）または文字（'A'など）で指定できます。
+        as_tuple を指定すると各行をタプルのまま返すため、行ごとのリストへのコピーが不要になります。
+        範囲が大きい場合は read_range_iter で1行ずつ処理してください。
+
+        Args:
+            sheet_name (str): シート名
+            start_row (int): 開始行
+            start_column (Union[int, str]): 開始列
+            end_row (int): 終了行
+            end_column (Union[int, str]): 終了列
+            as_tuple (bool): 各行をタプルで返すかどうか（デフォルト: False）
+
+        Returns:
+            List[List[Any]] | List[Tuple[Any, ...]]: 読み込んだデータ（2次元リスト、またはタプルのリスト）
+
+        Raises:
+            ValueError: シートが存在しない場合、または無効な範囲指定の場合、
+                または書き込み専用モードの場合
+        """
+        rows = self.read_range_iter(sheet_name, start_row, start_column, end_row, end_column)
+        return list(rows) if as_tuple else [list(row) for row in rows]
+
+    def read_range_array(
+        self,
+        sheet_name: str,
+        start_row: int,
+        start_column: Union[int, str],
+        end_row: int,
+        end_column: Union[int, str],
+        dtype: Any = None
+    ) -> "np.ndarray":
+        """
+        指定した範囲のデータをNumPy配列として読み込みます。
+
+        範囲の大きさで配列を事前に確保し、行ごとに直接書き込むため、
+        read_range の結果を改めて配列に変換するよりもコピーが少なく済みます。
+        数値の dtype（例: 'float64'）を指定すると、得られた配列をそのままNumbaの
+        @njit 関数などに渡せます。文字列などが混在するデータには read_range を使用してください。
+
+        Args:
+            sheet_name (str): シート名
+            start_row (int): 開始行
+            start_column (Union[int, str]): 開始列
+            end_row (int): 終了行
+            end_column (Union[int, str]): 終了列
+            dtype (Any): 配列のデータ型（デフォルト: None、object型になります）
+
+        Returns:
+            np.ndarray: 読み込んだデータ（行数×列数の2次元配列）
+
+        Raises:
+            ImportError: numpyがインストールされていない場合
+            ValueError: シートが存在しない場合、無効な範囲指定の場合、
+                指定した dtype に変換できない値が含まれる場合、
+                または書き込み専用モードの場合
+
+        Examples:
+            >>> arr = excel.read_range_array("Sheet1", 2, "A", 100, "C", dtype="float64")
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("read_range_array を使用するには numpy をインストールしてください")
+
+        self._ensure_random_access()
+        ws: Worksheet = self._get_sheet(sheet_name)
+        start_col, end_col = self._resolve_range(start_row, start_column, end_row, end_column)
+
+        row_count: int = end_row - start_row + 1
+        arr = np.empty((row_count, end_col - start_col + 1), dtype=dtype or object)
+        filled: int = 0
+        try:
+            for filled, row in enumerate(ws.iter_rows(
+                min_row=start_row,
+                max_row=end_row,
+                min_col=start_col,
+                max_col=end_col,
+                values_only=True
+            ), 1):
+                arr[filled - 1, :len(row)] = row
+            # 読み取り専用モードではシートの末尾より後ろの行が返されないため空のセルとして扱う
+            if filled < row_count:
+                arr[filled:] = None
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"dtype '{arr.dtype}' に変換できない値が含まれています: {str(e)}")
+        return arr
+
+    def save(self, compression: int = ZIP_DEFLATED, compresslevel: Optional[int] = None) -> None:
         """
         ワークブックを保存します。
 
@@ -367,17 +1308,66 @@ class ExcelManager:
         ファイルが他のプログラムで開かれている場合や、
         書き込み権限がない場合はエラーが発生します。
 
+        大量のデータを保存する場合は圧縮に時間がかかるため、compresslevel に
+        小さい値を指定するか、compression に ZIP_STORED を指定して無圧縮で保存すると
+        ファイルサイズと引き換えに保存を高速化できます。
+        圧縮の指定はopenpyxlを使用している場合のみ有効です。
+
+        Args:
+            compression (int): ZIPの圧縮方式（ZIP_DEFLATED または ZIP_STORED）（デフォルト: ZIP_DEFLATED）
+            compresslevel (Optional[int]): ZIP_DEFLATED の圧縮レベル（0～9）（デフォルト: None）
+
         Raises:
             PermissionError: ファイルへの書き込み権限がない場合
             OSError: ファイルの保存に失敗した場合
+            ValueError: 読み取り専用モードの場合、無効な圧縮方式・圧縮レベルの場合、
+                openpyxl以外のバックエンドで圧縮を指定した場合、
+                または書き込み専用モードで保存済みの場合
+
+        Examples:
+            >>> excel.save()
+            >>> excel.save(compresslevel=1)
+            >>> excel.save(compression=ZIP_STORED)
         """
+        self._ensure_writable()
+        if compression not in (ZIP_DEFLATED, ZIP_STORED):
+            raise ValueError(f"無効な圧縮方式です: {compression}")
+        if compresslevel is not None and not 0 <= compresslevel <= 9:
+            raise ValueError(f"無効な圧縮レベルです: {compresslevel}")
+        if self._backend is not None and (compression != ZIP_DEFLATED or compresslevel is not None):
+            raise ValueError(f"backend='{self._backend_name}' では圧縮方式・圧縮レベルは指定できません")
+        if self._write_only and self._saved:
+            # 保存済みのファイルを上書きで開いて空にしてしまう前にエラーにする
+            raise ValueError("書き込み専用モードのワークブックは一度しか保存できません")
         try:
-            self.wb.save(self.filename)
+            if self._backend is not None:
+                self._backend.save()
+                return
+            # 既存のファイルを上書きで開く前に、未読み込みのワークブックを読み込んでおく
+            wb = self.wb
+            # まとまった単位で書き出すよう、大きめのバッファでファイルを開いて渡す
+            with open(self.filename, 'wb', buffering=1 << 20) as f:
+                if compression == ZIP_DEFLATED and compresslevel is None:
+                    wb.save(f)
+                else:
+                    with _zip_options(compression, compresslevel):
+                        wb.save(f)
+            self._saved = True
         except PermissionError:
             raise PermissionError(f"ファイル '{self.filename}' への書き込み権限がありません")
         except OSError as e:
             raise OSError(f"ファイルの保存に失敗しました: {str(e)}")
 
+    def close(self) -> None:
+        """
+        ワークブックを閉じます。
+
+        読み取り専用モードで開いたファイルのハンドルを解放します。
+        通常モードやopenpyxl以外のバックエンドでは何もしません。
+        """
+        if self._wb is not None:
+            self._wb.close()
+
 def example_usage(filename: str) -> None:
     """
     使用例を示す関数
@@ -405,7 +1395,7 @@ def example_usage(filename: str) -> None:
     
     # 範囲データの読み込み
     range_data = excel.read_range("データ", 2, "A", 3, "C")
-    print(f"読み込んだデータ: {range_data}")
+    _log.info("読み込んだデータ: %s", range_data)
     
     excel.save()
     
@@ -414,6 +1404,7 @@ def main() -> None:
     parser = argparse.ArgumentParser(description='Excelファイル操作プログラム')
     parser.add_argument('-f', '--file', help='Excelファイルのパス', required=True)
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     try:
         example_usage(args.file)
     except Exception as e: